@@ -5,19 +5,19 @@ This module provides a centralized registry of all available analysis tools
 with descriptions, usage examples, and workflows.
 """
 
-from typing import Dict, List
+import sys
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
 
-class ToolInfo:
+class ToolInfo(NamedTuple):
     """Information about an analysis tool."""
-    
-    def __init__(self, name: str, module: str, description: str, 
-                 usage: str, examples: List[str], data_type: str = "both"):
-        self.name = name
-        self.module = module
-        self.description = description
-        self.usage = usage
-        self.examples = examples
-        self.data_type = data_type  # "partial", "combined", or "both"
+
+    name: str
+    module: str
+    description: str
+    usage: str
+    examples: Tuple[str, ...]
+    data_type: str = "both"  # "partial", "combined", or "both"
 
 # Registry of all available tools
 TOOLS = {
@@ -26,10 +26,10 @@ TOOLS = {
         module="analyzer_tools.partial_data_assessor",
         description="Assess quality of partial reflectometry data by analyzing overlap regions between data parts. Calculates chi-squared metrics and generates visualization reports.",
         usage="python analyzer_tools/partial_data_assessor.py <set_id>",
-        examples=[
+        examples=(
             "python analyzer_tools/partial_data_assessor.py 218281",
             "python analyzer_tools/partial_data_assessor.py 218328"
-        ],
+        ),
         data_type="partial"
     ),
     
@@ -38,10 +38,10 @@ TOOLS = {
         module="analyzer_tools.run_fit",
         description="Run reflectivity fits on combined data using specified models. Performs least-squares fitting and generates fit reports with uncertainty analysis.",
         usage="python analyzer_tools/run_fit.py <data_id> <model_name>",
-        examples=[
+        examples=(
             "python analyzer_tools/run_fit.py 218281 cu_thf",
             "python analyzer_tools/run_fit.py 218328 cu_thf_temp"
-        ],
+        ),
         data_type="combined"
     ),
     
@@ -50,10 +50,10 @@ TOOLS = {
         module="analyzer_tools.result_assessor",
         description="Assess quality of fitting results by analyzing chi-squared values, parameter uncertainties, and generating comparison plots.",
         usage="python analyzer_tools/result_assessor.py <data_id> <model_name>",
-        examples=[
+        examples=(
             "python analyzer_tools/result_assessor.py 218281 cu_thf",
             "python analyzer_tools/result_assessor.py 218328 cu_thf_temp"
-        ],
+        ),
         data_type="combined"
     ),
     
@@ -62,10 +62,10 @@ TOOLS = {
         module="analyzer_tools.create_model_script",
         description="Generate fitting scripts by combining model definitions with fitting commands. Useful for batch processing and reproducible analysis.",
         usage="python analyzer_tools/create_model_script.py <model_name> <data_file> [--model_dir DIR] [--output_dir DIR]",
-        examples=[
+        examples=(
             "python analyzer_tools/create_model_script.py cu_thf data.txt",
             "python analyzer_tools/create_model_script.py cu_thf data.txt --output_dir custom_output"
-        ],
+        ),
         data_type="combined"
     ),
     
@@ -74,10 +74,10 @@ TOOLS = {
         module="analyzer_tools.create_temporary_model",
         description="Create temporary models with adjusted parameter ranges for sensitivity analysis and parameter exploration.",
         usage="python analyzer_tools/create_temporary_model.py <base_model> <new_model> --adjust <param> <min>,<max>",
-        examples=[
+        examples=(
             "python analyzer_tools/create_temporary_model.py cu_thf cu_thf_temp --adjust Cu thickness 500,800",
             "python analyzer_tools/create_temporary_model.py cu_thf cu_thf_wide --adjust Cu thickness 300,1000"
-        ],
+        ),
         data_type="both"
     )
 }
@@ -87,120 +87,172 @@ WORKFLOWS = {
     "partial_data_quality": {
         "name": "Partial Data Quality Assessment",
         "description": "Assess the quality of partial reflectometry data before combining",
-        "steps": [
+        "steps": (
             "1. Use partial_data_assessor to check overlap quality",
             "2. Review chi-squared metrics (< 2.0 is typically good)",
             "3. Examine overlap plots for systematic deviations",
             "4. Identify problematic datasets for further investigation"
-        ],
-        "tools": ["partial_data_assessor"]
+        ),
+        "tools": ("partial_data_assessor",)
     },
     
     "standard_fitting": {
         "name": "Standard Reflectivity Fitting",
         "description": "Complete workflow for fitting reflectivity data",
-        "steps": [
+        "steps": (
             "1. Use run_fit to perform initial fitting",
             "2. Use result_assessor to evaluate fit quality",
             "3. If poor fit, use create_temporary_model to adjust parameters",
             "4. Re-run fitting with adjusted model",
             "5. Generate final reports"
-        ],
-        "tools": ["run_fit", "result_assessor", "create_temporary_model"]
+        ),
+        "tools": ("run_fit", "result_assessor", "create_temporary_model")
     },
     
     "parameter_exploration": {
         "name": "Parameter Sensitivity Analysis",
         "description": "Explore parameter sensitivity and uncertainty",
-        "steps": [
+        "steps": (
             "1. Start with standard fitting workflow",
             "2. Use create_temporary_model to create variants with different parameter ranges",
             "3. Run fits on multiple parameter sets",
             "4. Use result_assessor to compare results",
             "5. Identify sensitive parameters and optimal ranges"
-        ],
-        "tools": ["run_fit", "result_assessor", "create_temporary_model"]
+        ),
+        "tools": ("run_fit", "result_assessor", "create_temporary_model")
     }
 }
 
-def get_all_tools() -> Dict[str, ToolInfo]:
+# The registries are fixed at import time; expose them (and each workflow)
+# read-only so derived views can be shared safely.
+TOOLS = MappingProxyType(TOOLS)
+WORKFLOWS = MappingProxyType({name: MappingProxyType(workflow)
+                              for name, workflow in WORKFLOWS.items()})
+
+def _build_data_type_index(tools: Mapping[str, ToolInfo]) -> Dict[str, Mapping[str, ToolInfo]]:
+    """Group tools by the data type they accept.
+
+    Tools marked "both" are listed under every data type.
+    """
+    data_types = dict.fromkeys(["partial", "combined", "both"])
+    data_types.update(dict.fromkeys(tool.data_type for tool in tools.values()))
+    return {data_type: MappingProxyType({name: tool for name, tool in tools.items()
+                                         if tool.data_type in (data_type, "both")})
+            for data_type in data_types}
+
+_BY_TYPE = _build_data_type_index(TOOLS)
+
+def get_all_tools() -> Mapping[str, ToolInfo]:
     """Get all available tools."""
     return TOOLS
 
-def get_tool(tool_name: str) -> ToolInfo:
+def has_tool(tool_name: str) -> bool:
+    """Check whether a tool is registered."""
+    return tool_name in TOOLS
+
+def get_tool(tool_name: str) -> Optional[ToolInfo]:
     """Get information about a specific tool."""
     return TOOLS.get(tool_name)
 
-def get_tools_by_data_type(data_type: str) -> Dict[str, ToolInfo]:
-    """Get tools that work with a specific data type."""
-    return {name: tool for name, tool in TOOLS.items() 
-            if tool.data_type == data_type or tool.data_type == "both"}
+def get_tools(tool_names: Iterable[str]) -> Dict[str, ToolInfo]:
+    """Get information about several tools, skipping unknown names."""
+    return {name: tool for name in tool_names
+            if (tool := TOOLS.get(name)) is not None}
+
+def get_tools_by_data_type(data_type: str) -> Mapping[str, ToolInfo]:
+    """Get tools that work with a specific data type.
+
+    The result is a read-only view from an index built at import time.
+    """
+    return _BY_TYPE.get(data_type, _BY_TYPE["both"])
 
-def get_workflows() -> Dict[str, Dict]:
+def get_workflows() -> Mapping[str, Mapping]:
     """Get all available workflows."""
     return WORKFLOWS
 
-def print_tool_overview():
-    """Print a comprehensive overview of all tools."""
-    # Try to get config-based data organization, fall back to defaults
+def _get_data_org() -> dict:
+    """Get config-based data organization, falling back to defaults."""
     try:
-        import sys
-        import os
-        # Add parent directory to path for standalone execution
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.insert(0, parent_dir)
-        
         from analyzer_tools.config_utils import get_data_organization_info
-        data_org = get_data_organization_info()
+        return get_data_organization_info()
     except ImportError:
         # Fallback to defaults if config_utils can't be imported
-        data_org = {
+        return {
             'combined_data_dir': 'data/combined',
             'partial_data_dir': 'data/partial',
             'reports_dir': 'reports',
             'combined_data_template': 'REFL_{set_id}_combined_data_auto.txt',
             'models_dir': 'models'
         }
-    
-    print("=" * 70)
-    print("NEUTRON REFLECTOMETRY DATA ANALYSIS TOOLS")
-    print("=" * 70)
-    print()
-    
-    print("📊 AVAILABLE ANALYSIS TOOLS:")
-    print("-" * 40)
-    
-    for tool_name, tool in TOOLS.items():
-        print(f"\n🔧 {tool.name}")
-        print(f"   {tool.description}")
-        print(f"   Data type: {tool.data_type}")
-        print(f"   Usage: {tool.usage}")
-        if tool.examples:
-            print(f"   Example: {tool.examples[0]}")
-    
-    print("\n📋 ANALYSIS WORKFLOWS:")
-    print("-" * 40)
-    
-    for workflow_name, workflow in WORKFLOWS.items():
-        print(f"\n🔄 {workflow['name']}")
-        print(f"   {workflow['description']}")
-        print(f"   Tools used: {', '.join(workflow['tools'])}")
-    
-    print("\n📁 DATA ORGANIZATION:")
-    print("-" * 40)
-    print(f"   • Partial data: {data_org['partial_data_dir']}/ (REFL_<set_ID>_<part_ID>_<run_ID>_partial.txt)")
-    print(f"   • Combined data: {data_org['combined_data_dir']}/ ({data_org['combined_data_template']})")
-    print(f"   • Models: {data_org['models_dir']}/ (Python files with reflectivity models)")
-    print(f"   • Reports: {data_org['reports_dir']}/ (Generated analysis reports and plots)")
-    
-    print("\n🚀 QUICK START:")
-    print("-" * 40)
-    print("   1. For partial data quality: python analyzer_tools/partial_data_assessor.py 218281")
-    print("   2. For reflectivity fitting: python analyzer_tools/run_fit.py 218281 cu_thf")
-    print("   3. For result assessment: python analyzer_tools/result_assessor.py 218281 cu_thf")
-    
-    print("\n" + "=" * 70)
+
+_TOOL_TEMPLATE = (
+    "\n🔧 {name}\n"
+    "   {description}\n"
+    "   Data type: {data_type}\n"
+    "   Usage: {usage}"
+)
+_TOOL_EXAMPLE_TEMPLATE = "   Example: {}"
+
+def _build_overview_template(tools: Mapping[str, ToolInfo], workflows: Mapping[str, Mapping]) -> str:
+    """Render the overview, leaving %-placeholders for the data organization."""
+    lines = [
+        "=" * 70,
+        "NEUTRON REFLECTOMETRY DATA ANALYSIS TOOLS",
+        "=" * 70,
+        "",
+        "📊 AVAILABLE ANALYSIS TOOLS:",
+        "-" * 40,
+    ]
+
+    for name, _, description, usage, examples, data_type in tools.values():
+        lines.append(_TOOL_TEMPLATE.format(name=name, description=description,
+                                           data_type=data_type, usage=usage))
+        if examples:
+            lines.append(_TOOL_EXAMPLE_TEMPLATE.format(examples[0]))
+
+    lines.extend(("\n📋 ANALYSIS WORKFLOWS:", "-" * 40))
+
+    for workflow_name, workflow in workflows.items():
+        lines.extend((
+            f"\n🔄 {workflow['name']}",
+            f"   {workflow['description']}",
+            f"   Tools used: {', '.join(workflow['tools'])}",
+        ))
+
+    # Registry text is literal, so escape it before adding the placeholders
+    lines = [line.replace("%", "%%") for line in lines]
+
+    lines.extend((
+        "\n📁 DATA ORGANIZATION:",
+        "-" * 40,
+        "   • Partial data: %(partial_data_dir)s/ (REFL_<set_ID>_<part_ID>_<run_ID>_partial.txt)",
+        "   • Combined data: %(combined_data_dir)s/ (%(combined_data_template)s)",
+        "   • Models: %(models_dir)s/ (Python files with reflectivity models)",
+        "   • Reports: %(reports_dir)s/ (Generated analysis reports and plots)",
+    ))
+
+    lines.extend((
+        "\n🚀 QUICK START:",
+        "-" * 40,
+        "   1. For partial data quality: python analyzer_tools/partial_data_assessor.py 218281",
+        "   2. For reflectivity fitting: python analyzer_tools/run_fit.py 218281 cu_thf",
+        "   3. For result assessment: python analyzer_tools/result_assessor.py 218281 cu_thf",
+    ))
+
+    lines.append("\n" + "=" * 70)
+    return "\n".join(lines) + "\n"
+
+_OVERVIEW_TEMPLATE = _build_overview_template(TOOLS, WORKFLOWS)
+
+def print_tool_overview():
+    """Print a comprehensive overview of all tools."""
+    sys.stdout.write(_OVERVIEW_TEMPLATE % _get_data_org())
 
 if __name__ == "__main__":
+    import os
+    # Add parent directory to path for standalone execution
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+
     print_tool_overview()
@@ -2,12 +2,16 @@
 Tests for analyzer_tools.registry module.
 """
 
+from collections.abc import Mapping
 from unittest.mock import patch
 
+import pytest
+
 from analyzer_tools.registry import (
     ToolInfo, TOOLS, WORKFLOWS, 
-    get_all_tools, get_tool, get_tools_by_data_type, 
-    get_workflows, print_tool_overview
+    get_all_tools, get_tool, get_tools, get_tools_by_data_type, has_tool,
+    get_workflows, print_tool_overview,
+    _build_data_type_index, _build_overview_template
 )
 
 
@@ -21,7 +25,7 @@ class TestToolInfo:
             module="test.module", 
             description="A test tool",
             usage="test command",
-            examples=["test example"],
+            examples=("test example",),
             data_type="combined"
         )
         
@@ -29,7 +33,7 @@ class TestToolInfo:
         assert tool.module == "test.module"
         assert tool.description == "A test tool"
         assert tool.usage == "test command"
-        assert tool.examples == ["test example"]
+        assert tool.examples == ("test example",)
         assert tool.data_type == "combined"
     
     def test_tool_info_default_data_type(self):
@@ -39,11 +43,21 @@ class TestToolInfo:
             module="test.module",
             description="A test tool", 
             usage="test command",
-            examples=["test example"]
+            examples=("test example",)
         )
         
         assert tool.data_type == "both"
 
+    def test_tool_info_is_immutable(self):
+        """Test that ToolInfo is a hashable, read-only record."""
+        tool = get_tool("run_fit")
+        assert not hasattr(tool, "__dict__")
+        assert isinstance(tool.examples, tuple)
+        assert hash(tool) == hash(get_tool("run_fit"))
+
+        with pytest.raises(AttributeError):
+            tool.name = "Renamed"
+
 
 class TestToolRegistry:
     """Test the tool registry functions."""
@@ -52,9 +66,18 @@ class TestToolRegistry:
         """Test get_all_tools returns the TOOLS dict."""
         tools = get_all_tools()
         assert tools is TOOLS
-        assert isinstance(tools, dict)
+        assert isinstance(tools, Mapping)
         assert len(tools) > 0
     
+    def test_registries_are_read_only(self):
+        """Test that TOOLS and WORKFLOWS cannot be modified."""
+        with pytest.raises(TypeError):
+            TOOLS["new_tool"] = None
+        with pytest.raises(TypeError):
+            WORKFLOWS["new_workflow"] = {}
+        with pytest.raises(TypeError):
+            WORKFLOWS["standard_fitting"]["tools"] = ()
+
     def test_get_tool_existing(self):
         """Test get_tool for existing tool."""
         tool = get_tool("partial_data_assessor")
@@ -67,6 +90,36 @@ class TestToolRegistry:
         tool = get_tool("nonexistent_tool")
         assert tool is None
     
+    def test_get_tool_matches_tools(self):
+        """Test that get_tool returns the record stored in TOOLS."""
+        for name, tool in TOOLS.items():
+            assert get_tool(name) is tool
+
+    def test_patched_tools_seen_by_lookups(self):
+        """Test that patching TOOLS is reflected by get_all_tools and get_tool."""
+        with patch('analyzer_tools.registry.TOOLS', {}):
+            assert get_all_tools() == {}
+            assert get_tool("run_fit") is None
+
+    def test_patched_tools_seen_by_batch_lookups(self):
+        """Test that has_tool and get_tools follow a patched TOOLS."""
+        tool = get_tool("run_fit")
+        with patch('analyzer_tools.registry.TOOLS', {"x": tool}):
+            assert has_tool("x")
+            assert not has_tool("run_fit")
+            assert get_tools(["run_fit", "x"]) == {"x": tool}
+
+    def test_has_tool(self):
+        """Test has_tool for registered and unknown names."""
+        assert has_tool("run_fit")
+        assert not has_tool("nonexistent_tool")
+
+    def test_get_tools_skips_unknown(self):
+        """Test get_tools returns known tools in the requested order."""
+        tools = get_tools(["result_assessor", "nonexistent_tool", "run_fit"])
+        assert list(tools) == ["result_assessor", "run_fit"]
+        assert tools["run_fit"] is get_tool("run_fit")
+
     def test_get_tools_by_data_type_partial(self):
         """Test filtering tools by partial data type."""
         tools = get_tools_by_data_type("partial")
@@ -84,12 +137,38 @@ class TestToolRegistry:
         assert len(tools) > 0
         for name, tool in tools.items():
             assert tool.data_type in ["combined", "both"]
+
+    def test_get_tools_by_data_type_both(self):
+        """Test that tools marked 'both' appear under every data type."""
+        both = get_tools_by_data_type("both")
+        assert all(tool.data_type == "both" for tool in both.values())
+        for name in both:
+            assert name in get_tools_by_data_type("partial")
+            assert name in get_tools_by_data_type("combined")
+
+    def test_data_type_index_handles_other_types(self):
+        """Test that 'both' tools are indexed under data types outside the defaults."""
+        both = ToolInfo("A", "a", "a", "a", (), data_type="both")
+        raw = ToolInfo("B", "b", "b", "b", (), data_type="raw")
+
+        for tools in ({"a": both, "b": raw}, {"b": raw, "a": both}):
+            index = _build_data_type_index(tools)
+            assert list(index["raw"]) == list(tools)
+            assert list(index["partial"]) == ["a"]
+
+    def test_get_tools_by_data_type_cached(self):
+        """Test repeated queries return the same read-only mapping."""
+        tools = get_tools_by_data_type("partial")
+        assert get_tools_by_data_type("partial") is tools
+
+        with pytest.raises(TypeError):
+            tools["new_tool"] = None
     
     def test_get_workflows(self):
         """Test get_workflows returns the WORKFLOWS dict."""
         workflows = get_workflows()
         assert workflows is WORKFLOWS
-        assert isinstance(workflows, dict)
+        assert isinstance(workflows, Mapping)
         assert len(workflows) > 0
         
         # Check workflow structure
@@ -98,8 +177,8 @@ class TestToolRegistry:
             assert "description" in workflow
             assert "steps" in workflow
             assert "tools" in workflow
-            assert isinstance(workflow["steps"], list)
-            assert isinstance(workflow["tools"], list)
+            assert isinstance(workflow["steps"], tuple)
+            assert isinstance(workflow["tools"], tuple)
 
 
 class TestToolRegistryContent:
@@ -144,8 +223,7 @@ class TestToolRegistryContent:
 class TestPrintToolOverview:
     """Test the print_tool_overview function."""
     
-    @patch('builtins.print')
-    def test_print_tool_overview_with_config(self, mock_print):
+    def test_print_tool_overview_with_config(self, capsys):
         """Test print_tool_overview with mocked config."""
         mock_data_org = {
             'combined_data_dir': 'test_combined',
@@ -158,12 +236,7 @@ class TestPrintToolOverview:
         with patch('analyzer_tools.config_utils.get_data_organization_info', return_value=mock_data_org):
             print_tool_overview()
             
-            # Check that print was called
-            assert mock_print.called
-            
-            # Combine all print calls to check content
-            print_calls = [str(call) for call in mock_print.call_args_list]
-            combined_output = " ".join(print_calls)
+            combined_output = capsys.readouterr().out
             
             # Should contain configured paths
             assert "test_combined" in combined_output
@@ -176,19 +249,68 @@ class TestPrintToolOverview:
             assert "ANALYSIS WORKFLOWS" in combined_output
             assert "DATA ORGANIZATION" in combined_output
     
-    @patch('builtins.print') 
-    def test_print_tool_overview_fallback(self, mock_print):
+    def test_print_tool_overview_fallback(self, capsys):
         """Test print_tool_overview falls back gracefully when config fails."""
         # Simulate config import failure
         with patch('analyzer_tools.config_utils.get_data_organization_info', side_effect=ImportError):
             print_tool_overview()
             
             # Should still print something (with default values)
-            assert mock_print.called
-            
-            print_calls = [str(call) for call in mock_print.call_args_list]
-            combined_output = " ".join(print_calls)
+            combined_output = capsys.readouterr().out
             
             # Should contain default paths
             assert "data/combined" in combined_output
             assert "data/partial" in combined_output
+
+    def test_print_tool_overview_single_write(self):
+        """Test that the overview is written to stdout in a single call."""
+        with patch('sys.stdout') as mock_stdout:
+            print_tool_overview()
+
+        mock_stdout.write.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        assert output.endswith("=" * 70 + "\n")
+        for tool in TOOLS.values():
+            assert tool.name in output
+
+    def test_print_tool_overview_reflects_config_changes(self, capsys):
+        """Test that the cached overview still picks up the current config."""
+        data_org = {
+            'combined_data_dir': 'first_combined',
+            'partial_data_dir': 'first_partial',
+            'reports_dir': 'first_reports',
+            'combined_data_template': 'REFL_{set_id}_100%.txt',
+            'models_dir': 'first_models'
+        }
+        with patch('analyzer_tools.config_utils.get_data_organization_info', return_value=data_org):
+            print_tool_overview()
+        first_output = capsys.readouterr().out
+
+        data_org = dict(data_org, combined_data_dir='second_combined')
+        with patch('analyzer_tools.config_utils.get_data_organization_info', return_value=data_org):
+            print_tool_overview()
+        second_output = capsys.readouterr().out
+
+        assert "first_combined/ (REFL_{set_id}_100%.txt)" in first_output
+        assert "second_combined/" in second_output
+        assert "first_combined" not in second_output
+
+    def test_overview_template_escapes_registry_text(self):
+        """Test that a literal % in registry text survives rendering."""
+        tool = ToolInfo("Percent Tool", "pct", "Keeps 95% of points", "pct <file>",
+                        ("pct data.txt",))
+        workflow = {"name": "Percent Flow", "description": "Up to 100% coverage",
+                    "tools": ("pct",)}
+        template = _build_overview_template({"pct": tool}, {"flow": workflow})
+
+        output = template % {
+            'combined_data_dir': 'combined',
+            'partial_data_dir': 'partial',
+            'reports_dir': 'reports',
+            'combined_data_template': 'REFL_{set_id}.txt',
+            'models_dir': 'models'
+        }
+
+        assert "   Keeps 95% of points\n" in output
+        assert "   Up to 100% coverage\n" in output
+        assert "   • Combined data: combined/ (REFL_{set_id}.txt)" in output